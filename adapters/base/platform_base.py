@@ -3,6 +3,7 @@ Abstract base class for platform adapters.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
 from models.message import IncomingMessage, OutgoingMessage
@@ -17,6 +18,9 @@ class PlatformAdapter(ABC):
         """Initialize the adapter with configuration."""
         self.config = config
         self.platform = config.platform
+        # Platform is fixed for the adapter's lifetime; build ID prefixes once
+        self._user_id_prefix = f"user_{config.platform.value}_"
+        self._message_id_prefix = f"msg_{config.platform.value}_"
 
     @property
     @abstractmethod
@@ -39,6 +43,24 @@ class PlatformAdapter(ABC):
         """
         pass
 
+    async def parse_incoming_batch(
+        self, webhook_data: dict[str, Any]
+    ) -> list[IncomingMessage]:
+        """
+        Parse all messages contained in a single webhook delivery.
+
+        Platforms that batch several events per webhook should override this;
+        the default wraps parse_incoming().
+
+        Args:
+            webhook_data: Raw webhook data from platform
+
+        Returns:
+            List of normalized IncomingMessage objects (possibly empty)
+        """
+        message = await self.parse_incoming(webhook_data)
+        return [message] if message else []
+
     @abstractmethod
     async def format_outgoing(
         self, message: OutgoingMessage, user: User
@@ -83,12 +105,14 @@ class PlatformAdapter(ABC):
         pass
 
     @abstractmethod
-    async def validate_webhook(self, headers: dict[str, str], body: bytes) -> bool:
+    async def validate_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
         """
         Validate incoming webhook request.
 
         Args:
-            headers: HTTP headers from webhook request
+            headers: HTTP headers from webhook request (case-insensitive
+                mapping such as Starlette's Headers; do not assume a plain
+                dict with lowercased keys)
             body: Raw request body
 
         Returns:
@@ -106,7 +130,7 @@ class PlatformAdapter(ABC):
         Returns:
             Normalized user ID in format: user_{platform}_{platform_user_id}
         """
-        return f"user_{self.platform.value}_{platform_user_id}"
+        return self._user_id_prefix + platform_user_id
 
     def generate_message_id(self, platform_message_id: str) -> str:
         """
@@ -118,4 +142,4 @@ class PlatformAdapter(ABC):
         Returns:
             Normalized message ID in format: msg_{platform}_{platform_message_id}
         """
-        return f"msg_{self.platform.value}_{platform_message_id}"
+        return self._message_id_prefix + platform_message_id
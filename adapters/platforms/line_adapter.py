@@ -2,11 +2,15 @@
 LINE platform adapter implementation.
 """
 
+import asyncio
 import base64
+import binascii
 import hashlib
 import hmac
-from datetime import datetime
-from typing import Any
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Final
 
 from linebot.v3.messaging import ApiClient, Configuration, MessagingApi
 from linebot.v3.messaging.models import ReplyMessageRequest, TextMessage  # type: ignore
@@ -16,6 +20,45 @@ from models.message import IncomingMessage, MessageType, OutgoingMessage
 from models.platform import LineConfig, PlatformType
 from models.user import User, UserProfile
 
+# LINE message type -> normalized message type
+_LINE_MESSAGE_TYPES: Final[dict[str, MessageType]] = {
+    "text": MessageType.TEXT,
+    "image": MessageType.IMAGE,
+    "video": MessageType.VIDEO,
+    "audio": MessageType.AUDIO,
+    "file": MessageType.FILE,
+    "location": MessageType.LOCATION,
+    "sticker": MessageType.STICKER,
+}
+
+# LINE message type -> AdapterCapabilities flag that enables it
+_CAPABILITY_FLAGS: Final[dict[str, str]] = {
+    "text": "supports_text",
+    "image": "supports_images",
+    "video": "supports_video",
+    "audio": "supports_audio",
+    "file": "supports_files",
+    "location": "supports_location",
+    "sticker": "supports_stickers",
+}
+
+# Warnings returned in place of content that exceeds the configured limits
+_TEXT_TOO_LONG_TEMPLATE: Final = (
+    "ข้อความของคุณยาวเกินไป (ความยาว: {length} อักขระ, จำกัดสูงสุด: {limit} อักขระ)"
+)
+_TOO_LARGE_TEMPLATES: Final[dict[str, str]] = {
+    "image": "รูปภาพของคุณใหญ่เกินไป (ขนาด: {size:.1f}MB, จำกัดสูงสุด: {limit:.1f}MB)",
+    "video": "วิดีโอของคุณใหญ่เกินไป (ขนาด: {size:.1f}MB, จำกัดสูงสุด: {limit:.1f}MB)",
+    "audio": "ไฟล์เสียงของคุณใหญ่เกินไป (ขนาด: {size:.1f}MB, จำกัดสูงสุด: {limit:.1f}MB)",
+    "file": "ไฟล์ของคุณใหญ่เกินไป (ขนาด: {size:.1f}MB, จำกัดสูงสุด: {limit:.1f}MB)",
+}
+
+
+@lru_cache(maxsize=64)
+def _get_api_client(channel_access_token: str) -> ApiClient:
+    """Return a shared LINE API client (and connection pool) per access token."""
+    return ApiClient(Configuration(access_token=channel_access_token))
+
 
 class LineAdapter(PlatformAdapter):
     """LINE platform adapter."""
@@ -24,9 +67,11 @@ class LineAdapter(PlatformAdapter):
         """Initialize LINE adapter with LINE-specific configuration."""
         super().__init__(config)
         self.line_config = config
-        configuration = Configuration(access_token=config.channel_access_token)
-        api_client = ApiClient(configuration)
-        self.messaging_api = MessagingApi(api_client)
+        # Keyed HMAC prepared once; copied per request in validate_webhook
+        self._hmac_template = hmac.new(
+            config.channel_secret.encode("utf-8"), b"", hashlib.sha256
+        )
+        self.messaging_api = MessagingApi(_get_api_client(config.channel_access_token))
 
     @property
     def platform_type(self) -> PlatformType:
@@ -43,16 +88,44 @@ class LineAdapter(PlatformAdapter):
             webhook_data: LINE webhook payload
 
         Returns:
-            Normalized IncomingMessage or None if parsing fails
+            First normalized IncomingMessage or None if parsing fails
         """
-        try:
-            events = webhook_data.get("events", [])
-            if not events:
-                return None
+        messages = await self.parse_incoming_batch(webhook_data)
+        return messages[0] if messages else None
+
+    async def parse_incoming_batch(
+        self, webhook_data: dict[str, Any]
+    ) -> list[IncomingMessage]:
+        """
+        Parse every message event in a LINE webhook payload.
+
+        LINE may deliver several events in one webhook; each message event
+        becomes its own IncomingMessage with the event as its raw data.
+
+        Args:
+            webhook_data: LINE webhook payload
+
+        Returns:
+            List of normalized IncomingMessage objects (possibly empty)
+        """
+        messages = []
+        for event in webhook_data.get("events", []):
+            message = self._parse_event(event)
+            if message:
+                messages.append(message)
+        return messages
+
+    def _parse_event(self, event: dict[str, Any]) -> IncomingMessage | None:
+        """
+        Parse a single LINE webhook event into normalized message.
 
-            # Handle first message event (LINE typically sends one event per webhook)
-            event = events[0]
+        Args:
+            event: One entry of the webhook "events" list
 
+        Returns:
+            Normalized IncomingMessage or None if the event is not a message
+        """
+        try:
             # Only handle message events for now
             if event.get("type") != "message":
                 return None
@@ -71,38 +144,31 @@ class LineAdapter(PlatformAdapter):
             # Check capabilities before processing
             capabilities = self.line_config.capabilities
 
-            if line_message_type == "text" and not capabilities.supports_text:
-                print("Text messages are disabled in configuration")
-                return None
-            elif line_message_type == "image" and not capabilities.supports_images:
-                print("Image messages are disabled in configuration")
-                return None
-            elif line_message_type == "video" and not capabilities.supports_video:
-                print("Video messages are disabled in configuration")
-                return None
-            elif line_message_type == "audio" and not capabilities.supports_audio:
-                print("Audio messages are disabled in configuration")
-                return None
-            elif line_message_type == "file" and not capabilities.supports_files:
-                print("File messages are disabled in configuration")
-                return None
-            elif line_message_type == "location" and not capabilities.supports_location:
-                print("Location messages are disabled in configuration")
-                return None
-            elif line_message_type == "sticker" and not capabilities.supports_stickers:
-                print("Sticker messages are disabled in configuration")
+            capability_flag = _CAPABILITY_FLAGS.get(line_message_type)
+            if capability_flag and not getattr(capabilities, capability_flag):
+                print(
+                    f"{line_message_type.capitalize()} messages are disabled in configuration"
+                )
                 return None
 
             # Generate normalized IDs
             user_id = self.generate_user_id(platform_user_id)
             message_id = self.generate_message_id(message.get("id", ""))
 
-            # Determine message type and content
-            message_type = MessageType.TEXT  # Default to text
+            # LINE provides the event time in epoch milliseconds
+            event_time = event.get("timestamp")
+            timestamp = (
+                datetime.fromtimestamp(event_time / 1000, tz=UTC)
+                if event_time
+                else datetime.now(UTC)
+            )
+
+            # Determine message type and content (default to text)
+            message_type = _LINE_MESSAGE_TYPES.get(line_message_type, MessageType.TEXT)
             text_content = None
+            warning_text = None
 
             if line_message_type == "text":
-                message_type = MessageType.TEXT
                 text_content = message.get("text")
 
                 # Check text length limit
@@ -111,142 +177,55 @@ class LineAdapter(PlatformAdapter):
                     and capabilities.max_text_length is not None
                     and len(text_content) > capabilities.max_text_length
                 ):
-                    # Return a special message indicating text is too long
-                    return IncomingMessage(
-                        message_id=message_id,
-                        user_id=user_id,
-                        platform=self.platform.value,
-                        message_type=MessageType.TEXT,
-                        timestamp=datetime.now(),
-                        text=f"ข้อความของคุณยาวเกินไป (ความยาว: {len(text_content)} อักขระ, จำกัดสูงสุด: {capabilities.max_text_length} อักขระ)",
-                        raw_data=webhook_data,
-                        media=None,
-                        location=None,
-                        quick_reply_payload=None,
-                    )
-
-            elif line_message_type == "image":
-                message_type = MessageType.IMAGE
-
-                # Check file size limit for images
-                file_size = message.get("contentProvider", {}).get("contentLength", 0)
-                if (
-                    file_size
-                    and capabilities.max_file_size is not None
-                    and file_size > capabilities.max_file_size
-                ):
-                    file_size_mb = file_size / (1024 * 1024)
-                    max_size_mb = capabilities.max_file_size / (1024 * 1024)
-                    return IncomingMessage(
-                        message_id=message_id,
-                        user_id=user_id,
-                        platform=self.platform.value,
-                        message_type=MessageType.TEXT,
-                        timestamp=datetime.now(),
-                        text=f"รูปภาพของคุณใหญ่เกินไป (ขนาด: {file_size_mb:.1f}MB, จำกัดสูงสุด: {max_size_mb:.1f}MB)",
-                        raw_data=webhook_data,
-                        media=None,
-                        location=None,
-                        quick_reply_payload=None,
+                    warning_text = _TEXT_TOO_LONG_TEMPLATE.format(
+                        length=len(text_content),
+                        limit=capabilities.max_text_length,
                     )
 
-            elif line_message_type == "video":
-                message_type = MessageType.VIDEO
+            elif line_message_type == "sticker":
+                text_content = (
+                    f"[Sticker: {message.get('packageId')}/{message.get('stickerId')}]"
+                )
 
-                # Check file size limit for videos
-                file_size = message.get("contentProvider", {}).get("contentLength", 0)
-                if (
-                    file_size
-                    and capabilities.max_file_size is not None
-                    and file_size > capabilities.max_file_size
-                ):
-                    file_size_mb = file_size / (1024 * 1024)
-                    max_size_mb = capabilities.max_file_size / (1024 * 1024)
-                    return IncomingMessage(
-                        message_id=message_id,
-                        user_id=user_id,
-                        platform=self.platform.value,
-                        message_type=MessageType.TEXT,
-                        timestamp=datetime.now(),
-                        text=f"วิดีโอของคุณใหญ่เกินไป (ขนาด: {file_size_mb:.1f}MB, จำกัดสูงสุด: {max_size_mb:.1f}MB)",
-                        raw_data=webhook_data,
-                        media=None,
-                        location=None,
-                        quick_reply_payload=None,
+            elif line_message_type in _TOO_LARGE_TEMPLATES:
+                # Check file size limit; files report size directly, media
+                # through their content provider
+                if line_message_type == "file":
+                    file_size = message.get("fileSize", 0)
+                else:
+                    file_size = message.get("contentProvider", {}).get(
+                        "contentLength", 0
                     )
-
-            elif line_message_type == "audio":
-                message_type = MessageType.AUDIO
-
-                # Check file size limit for audio
-                file_size = message.get("contentProvider", {}).get("contentLength", 0)
                 if (
                     file_size
                     and capabilities.max_file_size is not None
                     and file_size > capabilities.max_file_size
                 ):
-                    file_size_mb = file_size / (1024 * 1024)
-                    max_size_mb = capabilities.max_file_size / (1024 * 1024)
-                    return IncomingMessage(
-                        message_id=message_id,
-                        user_id=user_id,
-                        platform=self.platform.value,
-                        message_type=MessageType.TEXT,
-                        timestamp=datetime.now(),
-                        text=f"ไฟล์เสียงของคุณใหญ่เกินไป (ขนาด: {file_size_mb:.1f}MB, จำกัดสูงสุด: {max_size_mb:.1f}MB)",
-                        raw_data=webhook_data,
-                        media=None,
-                        location=None,
-                        quick_reply_payload=None,
+                    warning_text = _TOO_LARGE_TEMPLATES[line_message_type].format(
+                        size=file_size / (1024 * 1024),
+                        limit=capabilities.max_file_size / (1024 * 1024),
                     )
-            elif line_message_type == "file":
-                message_type = MessageType.FILE
 
-                # Check file size limit
-                file_size = message.get("fileSize", 0)
-                if (
-                    capabilities.max_file_size is not None
-                    and file_size > capabilities.max_file_size
-                ):
-                    # Return a special message indicating file is too large
-                    file_size_mb = file_size / (1024 * 1024)
-                    max_size_mb = capabilities.max_file_size / (1024 * 1024)
-                    return IncomingMessage(
-                        message_id=message_id,
-                        user_id=user_id,
-                        platform=self.platform.value,
-                        message_type=MessageType.TEXT,
-                        timestamp=datetime.now(),
-                        text=f"ไฟล์ของคุณใหญ่เกินไป (ขนาด: {file_size_mb:.1f}MB, จำกัดสูงสุด: {max_size_mb:.1f}MB)",
-                        raw_data=webhook_data,
-                        media=None,
-                        location=None,
-                        quick_reply_payload=None,
-                    )
-
-            elif line_message_type == "location":
-                message_type = MessageType.LOCATION
-            elif line_message_type == "sticker":
-                message_type = MessageType.STICKER
-                text_content = (
-                    f"[Sticker: {message.get('packageId')}/{message.get('stickerId')}]"
-                )
+            if warning_text:
+                # Return a special message indicating the content exceeds limits
+                message_type = MessageType.TEXT
+                text_content = warning_text
 
             return IncomingMessage(
                 message_id=message_id,
                 user_id=user_id,
                 platform=self.platform.value,
                 message_type=message_type,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 text=text_content,
-                raw_data=webhook_data,
+                raw_data=event,
                 media=None,
                 location=None,
                 quick_reply_payload=None,
             )
 
         except Exception as e:
-            print(f"Error parsing LINE webhook: {e}")
+            print(f"Error parsing LINE webhook event: {e}")
             return None
 
     async def format_outgoing(
@@ -303,7 +282,8 @@ class LineAdapter(PlatformAdapter):
                 replyToken=reply_token, messages=[line_message]
             )  # type: ignore
 
-            self.messaging_api.reply_message(request)
+            # The SDK client is synchronous; keep the event loop free
+            await asyncio.to_thread(self.messaging_api.reply_message, request)
             return True
 
         except Exception as e:
@@ -344,7 +324,7 @@ class LineAdapter(PlatformAdapter):
             print(f"Error getting LINE user profile: {e}")
             return None
 
-    async def validate_webhook(self, headers: dict[str, str], body: bytes) -> bool:
+    async def validate_webhook(self, headers: Mapping[str, str], body: bytes) -> bool:
         """
         Validate LINE webhook signature.
 
@@ -360,16 +340,18 @@ class LineAdapter(PlatformAdapter):
             if not signature:
                 return False
 
-            # Create hash using channel secret
-            hash_value = hmac.new(
-                self.line_config.channel_secret.encode("utf-8"), body, hashlib.sha256
-            ).digest()
-
             # LINE sends signature in base64 format, not hex with sha256 prefix
-            expected_signature = base64.b64encode(hash_value).decode("utf-8")
+            try:
+                signature_bytes = base64.b64decode(signature, validate=True)
+            except binascii.Error:
+                return False
+
+            # Create hash using channel secret
+            mac = self._hmac_template.copy()
+            mac.update(body)
 
-            # Compare signatures
-            return hmac.compare_digest(signature, expected_signature)
+            # Compare raw digests
+            return hmac.compare_digest(signature_bytes, mac.digest())
 
         except Exception as e:
             print(f"Error validating LINE webhook: {e}")
@@ -1,7 +0,0 @@
-"""
-Base classes and interfaces for platform adapters.
-"""
-
-from .platform_base import PlatformAdapter
-
-__all__ = ["PlatformAdapter"]
\ No newline at end of file
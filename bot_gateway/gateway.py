@@ -2,18 +2,74 @@
 Central bot gateway for handling normalized messages from all platforms.
 """
 
-from typing import Any
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar, Final
 
 from models.message import IncomingMessage, MessageType, OutgoingMessage
 from models.user import User
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Size/length limit warnings generated by adapters; these are returned as-is
+_WARNING_PREFIXES: Final[tuple[str, ...]] = (
+    "ข้อความของคุณยาวเกินไป",
+    "ไฟล์ของคุณใหญ่เกินไป",
+    "รูปภาพของคุณใหญ่เกินไป",
+    "วิดีโอของคุณใหญ่เกินไป",
+    "ไฟล์เสียงของคุณใหญ่เกินไป",
+)
+
+
+def _text_response(text: str) -> OutgoingMessage:
+    """Build a plain text outgoing message."""
+    return OutgoingMessage(
+        message_type=MessageType.TEXT,
+        text=text,
+        media=None,
+        location=None,
+        quick_replies=None,
+    )
 
 
 class BotGateway:
     """Central gateway for processing messages from all platforms."""
 
-    def __init__(self):
-        """Initialize the bot gateway."""
-        pass
+    # Fixed replies for non-text message types, validated once; callers get
+    # a copy because frozen models still hold mutable platform_data
+    _NON_TEXT_RESPONSES: ClassVar[Mapping[MessageType, OutgoingMessage]] = (
+        MappingProxyType(
+            {
+                MessageType.STICKER: _text_response("I received a sticker! 😊"),
+                MessageType.IMAGE: _text_response("I received an image! 📷"),
+                MessageType.VIDEO: _text_response("I received a video! 🎥"),
+                MessageType.AUDIO: _text_response("I received an audio message! 🎵"),
+                MessageType.LOCATION: _text_response("I received a location! 📍"),
+            }
+        )
+    )
+    _UNKNOWN_TYPE_RESPONSE: ClassVar[OutgoingMessage] = _text_response(
+        "I received a message, but I'm not sure how to respond to this type yet."
+    )
+
+    def __init__(self, max_concurrency: int = 5):
+        """
+        Initialize the bot gateway.
+
+        Args:
+            max_concurrency: Maximum number of messages handled concurrently
+                by handle_batch(), across all batches
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def handle_message(
         self, message: IncomingMessage, user: User
@@ -28,73 +84,82 @@ class BotGateway:
         Returns:
             Normalized outgoing message response
         """
-        # Print message details for debugging
-        print("=" * 50)
-        print("=> INCOMING MESSAGE")
-        print("=" * 50)
-        print(f"Platform: {message.platform}")
-        print(f"User ID: {message.user_id}")
-        print(f"Message Type: {message.message_type.value}")
-        print(f"Text: {message.text}")
-        print(f"Timestamp: {message.timestamp}")
-        print("=" * 50)
-
-        # Print user details
-        print("=> USER INFO")
-        print("=" * 50)
-        print(
-            f"Display Name: {user.profile.display_name if user.profile else 'Unknown'}"
-        )
-        print(f"Platform User ID: {user.platform_user_id}")
-        print(f"Message Count: {user.message_count}")
-        print("=" * 50)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Incoming message platform=%s user_id=%s type=%s text=%r timestamp=%s",
+                message.platform,
+                message.user_id,
+                message.message_type.value,
+                message.text,
+                message.timestamp,
+            )
+            logger.debug(
+                "User display_name=%s platform_user_id=%s message_count=%d",
+                user.profile.display_name if user.profile else "Unknown",
+                user.platform_user_id,
+                user.message_count,
+            )
 
         # Check if this is a size/length limit warning message
         if (
             message.message_type == MessageType.TEXT
             and message.text
-            and (
-                message.text.startswith("ข้อความของคุณยาวเกินไป")
-                or message.text.startswith("ไฟล์ของคุณใหญ่เกินไป")
-                or message.text.startswith("รูปภาพของคุณใหญ่เกินไป")
-                or message.text.startswith("วิดีโอของคุณใหญ่เกินไป")
-                or message.text.startswith("ไฟล์เสียงของคุณใหญ่เกินไป")
-            )
+            and message.text.startswith(_WARNING_PREFIXES)
         ):
             # Return the warning message as-is (no echo)
-            response_text = message.text
+            response = _text_response(message.text)
         # Simple echo response for normal messages
         elif message.message_type == MessageType.TEXT and message.text:
-            response_text = f"Echo: {message.text}"
-        elif message.message_type == MessageType.STICKER:
-            response_text = "I received a sticker! 😊"
-        elif message.message_type == MessageType.IMAGE:
-            response_text = "I received an image! 📷"
-        elif message.message_type == MessageType.VIDEO:
-            response_text = "I received a video! 🎥"
-        elif message.message_type == MessageType.AUDIO:
-            response_text = "I received an audio message! 🎵"
-        elif message.message_type == MessageType.LOCATION:
-            response_text = "I received a location! 📍"
+            response = _text_response(f"Echo: {message.text}")
         else:
-            response_text = "I received a message, but I'm not sure how to respond to this type yet."
-
-        # Create response message
-        response = OutgoingMessage(
-            message_type=MessageType.TEXT,
-            text=response_text,
-            media=None,
-            location=None,
-            quick_replies=None,
-        )
+            response = self._NON_TEXT_RESPONSES.get(
+                message.message_type, self._UNKNOWN_TYPE_RESPONSE
+            ).model_copy(deep=True)
 
-        print("=> OUTGOING MESSAGE")
-        print("=" * 50)
-        print(f"Response: {response_text}")
-        print("=" * 50)
+        logger.debug("Outgoing response text=%r", response.text)
 
         return response
 
+    async def handle_batch(
+        self,
+        items: list[tuple[IncomingMessage, User]],
+        on_response: Callable[[OutgoingMessage, User], Awaitable[Any]] | None = None,
+    ) -> list[OutgoingMessage]:
+        """
+        Handle several incoming messages, concurrently across users.
+
+        Messages are grouped by sender; each user's messages are handled one
+        after another in their original order, and only the groups run
+        concurrently. At most max_concurrency messages are processed at the
+        same time, shared across concurrent webhooks, so downstream services
+        are not overwhelmed by large or overlapping batches.
+
+        Args:
+            items: Pairs of normalized incoming message and its sender
+            on_response: Optional coroutine awaited with each response before
+                the same user's next message is handled (e.g. to send a reply)
+
+        Returns:
+            Outgoing message responses in the same order as items
+        """
+        groups: dict[str, list[int]] = {}
+        for index, (message, _user) in enumerate(items):
+            groups.setdefault(message.user_id, []).append(index)
+
+        responses: list[OutgoingMessage | None] = [None] * len(items)
+
+        async def _handle_group(indexes: list[int]) -> None:
+            for index in indexes:
+                message, user = items[index]
+                async with self._semaphore:
+                    response = await self.handle_message(message, user)
+                responses[index] = response
+                if on_response is not None:
+                    await on_response(response, user)
+
+        await asyncio.gather(*(_handle_group(indexes) for indexes in groups.values()))
+        return [response for response in responses if response is not None]
+
     def get_status(self) -> dict[str, Any]:
         """
         Get gateway status information.
@@ -1,16 +1,39 @@
 # Configuration settings for the chatbot application
 # Includes environment variables, API keys, and general configuration
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-def load_config():
-    """Load configuration from config.yaml file."""
-    config_path = Path(__file__).parent.parent / "config.yaml"
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
 
+
+@lru_cache(maxsize=2)
+def _load_config_cached(config_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse config file; cached per file modification time."""
     with open(config_path) as file:
-        config = yaml.safe_load(file)
+        config: dict[str, Any] = yaml.load(file, Loader=SafeLoader)
 
     return config
+
+
+def load_config() -> dict[str, Any]:
+    """
+    Load configuration from config.yaml file.
+
+    The parsed result is cached and reloaded only when the file changes.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _load_config_cached(CONFIG_PATH, CONFIG_PATH.stat().st_mtime_ns)
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached configuration so the next load re-reads the file."""
+    _load_config_cached.cache_clear()
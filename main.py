@@ -2,13 +2,22 @@
 FastAPI application with LINE webhook integration.
 """
 
+import asyncio
+import json
+import os
+
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from adapters.platforms.line_adapter import LineAdapter
 from bot_gateway.gateway import BotGateway
 from config.settings import load_config
+from models.message import OutgoingMessage
 from models.platform import LineConfig
+from models.user import User
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -17,12 +26,14 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# Initialize components
-gateway = BotGateway()
-
 # Load configuration from config.yaml
 config = load_config()
 
+# Initialize components
+gateway = BotGateway(
+    max_concurrency=config.get("gateway", {}).get("max_concurrency", 5)
+)
+
 # LINE configuration
 line_platform_config = config["platforms"]["line"]
 line_config = LineConfig(
@@ -33,6 +44,21 @@ line_config = LineConfig(
 
 line_adapter = LineAdapter(line_config)
 
+# Bound concurrent LINE replies with the same limit as gateway handling
+_reply_semaphore = asyncio.Semaphore(gateway.max_concurrency)
+
+# Pre-serialized bodies for the webhook's fixed JSON responses
+_NO_MESSAGE_BODY = b'{"message":"No message to process"}'
+_SUCCESS_BODY = b'{"message":"Message processed successfully"}'
+_SEND_FAILED_BODY = b'{"message":"Failed to send response"}'
+
+
+def _json_response(body: bytes, status_code: int) -> Response:
+    """Wrap an already-serialized JSON body in a response."""
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
+
 
 @app.get("/")
 async def root():
@@ -50,6 +76,17 @@ async def get_status():
     }
 
 
+async def _send_line_reply(response_message: OutgoingMessage, user: User) -> bool:
+    """Format a gateway response for LINE and send it to the user."""
+    formatted_response = await line_adapter.format_outgoing(response_message, user)
+    logger.debug("Formatted response: %s", formatted_response)
+    async with _reply_semaphore:
+        sent = await line_adapter.send_message(formatted_response, user)
+    if not sent:
+        logger.warning("Failed to send LINE reply to %s", user.platform_user_id)
+    return sent
+
+
 @app.post("/webhooks/line")
 async def line_webhook(request: Request):
     """
@@ -58,88 +95,74 @@ async def line_webhook(request: Request):
     Handles incoming messages from LINE platform.
     """
     try:
-        # Get request body and headers
+        # Get request body
         body = await request.body()
-        headers = dict(request.headers)
 
         # Validate webhook signature
-        is_valid = await line_adapter.validate_webhook(headers, body)
+        is_valid = await line_adapter.validate_webhook(request.headers, body)
         if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid webhook signature",
             )
 
-        # Parse webhook data
-        webhook_data = await request.json()
-        print("==========")
-        print(f"Webhook data: {webhook_data}")
-        print("==========")
-        # Parse incoming message
-        incoming_message = await line_adapter.parse_incoming(webhook_data)
-        print("==========")
-        print(f"Incoming message: {incoming_message}")
-        print("==========")
-        if not incoming_message:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={"message": "No message to process"},
-            )
-
-        # Get user profile
-        platform_user_id = None
-        events = webhook_data.get("events", [])
-        if events and events[0].get("source"):
-            platform_user_id = events[0]["source"].get("userId")
-
-        if not platform_user_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No user ID found in webhook",
+        # Parse webhook data from the body already read for validation
+        webhook_data = json.loads(body)
+        logger.debug("Webhook data: %s", webhook_data)
+
+        # Parse every message event in the webhook
+        incoming_messages = await line_adapter.parse_incoming_batch(webhook_data)
+        logger.debug("Incoming messages: %s", incoming_messages)
+        if not incoming_messages:
+            return _json_response(_NO_MESSAGE_BODY, status.HTTP_200_OK)
+
+        # Get user profile for each message (raw_data holds the LINE event)
+        profiles = await asyncio.gather(
+            *(
+                line_adapter.get_user_profile(message.raw_data["source"]["userId"])
+                for message in incoming_messages
             )
-
-        user = await line_adapter.get_user_profile(platform_user_id)
-        print("==========")
-        print(f"User: {user}")
-        print("==========")
-        if not user:
+        )
+        logger.debug("Users: %s", profiles)
+        users: list[User] = [user for user in profiles if user is not None]
+        if len(users) != len(incoming_messages):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Could not get user profile",
             )
 
         # Add reply token to user data for sending response
-        if events and events[0].get("replyToken"):
-            user.platform_data["reply_token"] = events[0]["replyToken"]
-
-        # Process message through gateway
-        response_message = await gateway.handle_message(incoming_message, user)
-        print("==========")
-        print(f"Response message: {response_message}")
-        print("==========")
-        # Format response for LINE
-        formatted_response = await line_adapter.format_outgoing(response_message, user)
-        print("==========")
-        print(f"Formatted response: {formatted_response}")
-        print("==========")
-        # Send response back to LINE
-        success = await line_adapter.send_message(formatted_response, user)
-
-        if success:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={"message": "Message processed successfully"},
-            )
+        for message, user in zip(incoming_messages, users, strict=True):
+            reply_token = message.raw_data.get("replyToken")
+            if reply_token:
+                user.platform_data["reply_token"] = reply_token
+
+        # Process messages through gateway and reply to each one as soon as
+        # it is handled; a user's messages are answered in order. Reply
+        # tokens are single-use, so the batch only fails when nothing was
+        # sent; otherwise a LINE redelivery would re-handle events that were
+        # already answered.
+        results: list[bool] = []
+
+        async def _reply(response_message: OutgoingMessage, user: User) -> None:
+            results.append(await _send_line_reply(response_message, user))
+
+        response_messages = await gateway.handle_batch(
+            list(zip(incoming_messages, users, strict=True)), on_response=_reply
+        )
+        logger.debug("Response messages: %s", response_messages)
+
+        if any(results):
+            return _json_response(_SUCCESS_BODY, status.HTTP_200_OK)
         else:
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={"message": "Failed to send response"},
+            return _json_response(
+                _SEND_FAILED_BODY, status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
     except HTTPException:
         raise
-    except Exception as e:
-        print(f"Error processing LINE webhook: {e}")
+    except Exception:
+        logger.exception("Error processing LINE webhook")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error",
@@ -155,8 +178,19 @@ def main():
     print("🔧 Health check: /")
     print("📊 Status endpoint: /status")
 
+    # Auto-reload spawns a file watcher; only enable it for local development
+    reload = os.environ.get("CHAT_CHAT_RELOAD", "0") == "1"
+    workers = int(os.environ.get("CHAT_CHAT_WORKERS", "1"))
+
     # Run the FastAPI app
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        workers=None if reload else workers,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 Pydantic models for normalized message structures across platforms.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
@@ -70,7 +70,7 @@ class IncomingMessage(BaseModel):
     platform: str = Field(..., description="Source platform (line, facebook, web)")
     message_type: MessageType = Field(..., description="Type of message")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Message timestamp"
+        default_factory=lambda: datetime.now(UTC), description="Message timestamp"
     )
 
     # Content fields
@@ -110,4 +110,7 @@ class OutgoingMessage(BaseModel):
     class Config:
         """Pydantic configuration."""
 
+        # Fields cannot be reassigned; nested containers such as platform_data
+        # stay mutable, so copy shared instances before handing them out
+        frozen = True
         json_encoders = {datetime: lambda v: v.isoformat()}
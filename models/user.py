@@ -2,7 +2,7 @@
 User-related Pydantic models.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -32,10 +32,12 @@ class User(BaseModel):
 
     # Metadata
     first_seen: datetime = Field(
-        default_factory=datetime.utcnow, description="First interaction timestamp"
+        default_factory=lambda: datetime.now(UTC),
+        description="First interaction timestamp",
     )
     last_seen: datetime = Field(
-        default_factory=datetime.utcnow, description="Last interaction timestamp"
+        default_factory=lambda: datetime.now(UTC),
+        description="Last interaction timestamp",
     )
     message_count: int = Field(0, description="Total messages from this user")
 
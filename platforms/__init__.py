@@ -1,9 +0,0 @@
-"""
-Platform-specific adapter implementations.
-"""
-
-from .line_adapter import LineAdapter
-
-__all__ = [
-    "LineAdapter",
-]
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures.
+"""
+
+import importlib
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+
+import pytest
+
+from adapters.platforms.line_adapter import LineAdapter
+from models.platform import LineConfig
+from tests.helpers import CHANNEL_SECRET
+
+_TEST_CONFIG = f"""
+gateway:
+  max_concurrency: 2
+platforms:
+  line:
+    channel_access_token: test-access-token
+    channel_secret: {CHANNEL_SECRET}
+"""
+
+
+@pytest.fixture
+def line_adapter() -> LineAdapter:
+    """LINE adapter with test credentials."""
+    return LineAdapter(
+        LineConfig(
+            channel_access_token="test-access-token",
+            channel_secret=CHANNEL_SECRET,
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def main_module(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ModuleType]:
+    """Import main against a temporary config.yaml."""
+    config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    config_path.write_text(_TEST_CONFIG)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("config.settings.CONFIG_PATH", config_path)
+        sys.modules.pop("main", None)
+        module = importlib.import_module("main")
+        yield module
+        sys.modules.pop("main", None)
@@ -0,0 +1,28 @@
+"""
+Helpers for building signed LINE webhook requests in tests.
+"""
+
+import base64
+import hashlib
+import hmac
+
+CHANNEL_SECRET = "test-channel-secret"
+
+
+def sign(body: bytes) -> str:
+    """Compute the x-line-signature header value for a request body."""
+    digest = hmac.new(CHANNEL_SECRET.encode("utf-8"), body, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def line_message_event(
+    user_id: str, text: str, reply_token: str, message_id: str = "1"
+) -> dict[str, object]:
+    """Build a LINE text message webhook event."""
+    return {
+        "type": "message",
+        "timestamp": 1700000000000,
+        "replyToken": reply_token,
+        "source": {"type": "user", "userId": user_id},
+        "message": {"id": message_id, "type": "text", "text": text},
+    }
@@ -0,0 +1,116 @@
+"""
+Tests for the central bot gateway.
+"""
+
+import asyncio
+
+import pytest
+
+from bot_gateway.gateway import BotGateway
+from models.message import IncomingMessage, MessageType, OutgoingMessage
+from models.platform import PlatformType
+from models.user import User
+
+
+def _incoming(user_id: str, text: str) -> IncomingMessage:
+    return IncomingMessage(
+        message_id=f"msg_{text}",
+        user_id=user_id,
+        platform=PlatformType.LINE.value,
+        message_type=MessageType.TEXT,
+        text=text,
+        media=None,
+        location=None,
+        quick_reply_payload=None,
+    )
+
+
+def _user(user_id: str) -> User:
+    return User(
+        user_id=user_id,
+        platform=PlatformType.LINE,
+        platform_user_id=user_id,
+        message_count=0,
+        profile=None,
+    )
+
+
+@pytest.mark.unit
+def test_rejects_max_concurrency_below_one() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        BotGateway(max_concurrency=0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_batch_preserves_order() -> None:
+    gateway = BotGateway(max_concurrency=2)
+    items = [
+        (_incoming("a", "a1"), _user("a")),
+        (_incoming("b", "b1"), _user("b")),
+        (_incoming("a", "a2"), _user("a")),
+        (_incoming("c", "c1"), _user("c")),
+    ]
+
+    responses = await gateway.handle_batch(items)
+
+    assert [response.text for response in responses] == [
+        "Echo: a1",
+        "Echo: b1",
+        "Echo: a2",
+        "Echo: c1",
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_batch_answers_each_user_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = BotGateway(max_concurrency=5)
+    handle_message = gateway.handle_message
+    # Earlier messages are slower, so unordered handling would overtake them
+    delays = {"a1": 0.03, "a2": 0.0, "b1": 0.01, "b2": 0.0}
+
+    async def slow_handle_message(
+        message: IncomingMessage, user: User
+    ) -> OutgoingMessage:
+        await asyncio.sleep(delays[message.text or ""])
+        return await handle_message(message, user)
+
+    monkeypatch.setattr(gateway, "handle_message", slow_handle_message)
+
+    sent: list[str | None] = []
+
+    async def on_response(response: OutgoingMessage, user: User) -> None:
+        sent.append(response.text)
+
+    items = [
+        (_incoming("a", "a1"), _user("a")),
+        (_incoming("b", "b1"), _user("b")),
+        (_incoming("a", "a2"), _user("a")),
+        (_incoming("b", "b2"), _user("b")),
+    ]
+
+    await gateway.handle_batch(items, on_response=on_response)
+
+    assert sent.index("Echo: a1") < sent.index("Echo: a2")
+    assert sent.index("Echo: b1") < sent.index("Echo: b2")
+    # Different users are still handled concurrently
+    assert sent[0] == "Echo: b1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fixed_responses_are_not_shared() -> None:
+    gateway = BotGateway()
+    sticker = _incoming("a", "s").model_copy(
+        update={"message_type": MessageType.STICKER, "text": None}
+    )
+
+    first = await gateway.handle_message(sticker, _user("a"))
+    first.platform_data["leak"] = True
+    second = await gateway.handle_message(sticker, _user("b"))
+
+    assert second.text == "I received a sticker! 😊"
+    assert second.platform_data == {}
@@ -0,0 +1,84 @@
+"""
+Tests for the LINE platform adapter.
+"""
+
+import pytest
+
+from adapters.platforms.line_adapter import LineAdapter
+from models.message import MessageType
+from tests.helpers import line_message_event, sign
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_incoming_batch_skips_non_message_events(
+    line_adapter: LineAdapter,
+) -> None:
+    first = line_message_event("U1", "hello", "token-1", message_id="m1")
+    sticker = {
+        "type": "message",
+        "timestamp": 1700000000001,
+        "replyToken": "token-2",
+        "source": {"type": "user", "userId": "U2"},
+        "message": {"id": "m2", "type": "sticker", "packageId": "1", "stickerId": "2"},
+    }
+    webhook_data = {
+        "destination": "Ubot",
+        "events": [
+            {"type": "follow", "replyToken": "t", "source": {"userId": "U1"}},
+            first,
+            {"type": "postback", "postback": {"data": "x"}, "source": {"userId": "U1"}},
+            {"type": "message", "message": {"id": "m3", "type": "text", "text": "x"}},
+            sticker,
+            {"type": "unfollow", "source": {"userId": "U2"}},
+        ],
+    }
+
+    messages = await line_adapter.parse_incoming_batch(webhook_data)
+
+    assert [message.message_id for message in messages] == [
+        "msg_line_m1",
+        "msg_line_m2",
+    ]
+    assert [message.message_type for message in messages] == [
+        MessageType.TEXT,
+        MessageType.STICKER,
+    ]
+    assert messages[0].text == "hello"
+    assert messages[0].user_id == "user_line_U1"
+    # raw_data is the single event, not the whole webhook payload
+    assert messages[0].raw_data == first
+    assert messages[1].raw_data == sticker
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_incoming_returns_first_message(line_adapter: LineAdapter) -> None:
+    webhook_data = {
+        "events": [
+            {"type": "follow", "source": {"userId": "U1"}},
+            line_message_event("U1", "first", "token-1", message_id="m1"),
+            line_message_event("U1", "second", "token-2", message_id="m2"),
+        ]
+    }
+
+    message = await line_adapter.parse_incoming(webhook_data)
+
+    assert message is not None
+    assert message.text == "first"
+    assert await line_adapter.parse_incoming({"events": []}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_validate_webhook(line_adapter: LineAdapter) -> None:
+    body = b'{"events":[]}'
+
+    assert await line_adapter.validate_webhook({"x-line-signature": sign(body)}, body)
+    assert not await line_adapter.validate_webhook(
+        {"x-line-signature": sign(b"{}")}, body
+    )
+    assert not await line_adapter.validate_webhook(
+        {"x-line-signature": "not base64!"}, body
+    )
+    assert not await line_adapter.validate_webhook({}, body)
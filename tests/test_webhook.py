@@ -0,0 +1,129 @@
+"""
+Tests for the LINE webhook endpoint.
+"""
+
+import json
+from types import ModuleType
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.helpers import line_message_event, sign
+
+
+class _FakeReplyMessage:
+    """Stand-in for MessagingApi.reply_message that fails for given tokens."""
+
+    def __init__(self, failing_tokens: set[str]) -> None:
+        self.failing_tokens = failing_tokens
+        self.calls: list[Any] = []
+
+    def __call__(self, request: Any) -> None:
+        self.calls.append(request)
+        if request.reply_token in self.failing_tokens:
+            raise RuntimeError("reply token expired")
+
+
+def _post(main_module: ModuleType, events: list[dict[str, Any]]) -> Any:
+    body = json.dumps({"destination": "Ubot", "events": events}).encode("utf-8")
+    with TestClient(main_module.app) as client:
+        return client.post(
+            "/webhooks/line",
+            content=body,
+            headers={"X-Line-Signature": sign(body)},
+        )
+
+
+@pytest.fixture
+def reply_message(
+    main_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> _FakeReplyMessage:
+    fake = _FakeReplyMessage(set())
+    monkeypatch.setattr(main_module.line_adapter.messaging_api, "reply_message", fake)
+    return fake
+
+
+@pytest.mark.integration
+def test_partial_reply_failure_returns_200(
+    main_module: ModuleType, reply_message: _FakeReplyMessage
+) -> None:
+    reply_message.failing_tokens = {"token-2"}
+
+    response = _post(
+        main_module,
+        [
+            line_message_event("U1", "hello", "token-1", message_id="m1"),
+            line_message_event("U2", "hi", "token-2", message_id="m2"),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "Message processed successfully"}
+    assert sorted(call.reply_token for call in reply_message.calls) == [
+        "token-1",
+        "token-2",
+    ]
+
+
+@pytest.mark.integration
+def test_all_replies_failing_returns_500(
+    main_module: ModuleType, reply_message: _FakeReplyMessage
+) -> None:
+    reply_message.failing_tokens = {"token-1", "token-2"}
+
+    response = _post(
+        main_module,
+        [
+            line_message_event("U1", "hello", "token-1", message_id="m1"),
+            line_message_event("U2", "hi", "token-2", message_id="m2"),
+        ],
+    )
+
+    assert response.status_code == 500
+    assert response.json() == {"message": "Failed to send response"}
+
+
+@pytest.mark.integration
+def test_replies_to_same_user_in_order(
+    main_module: ModuleType, reply_message: _FakeReplyMessage
+) -> None:
+    response = _post(
+        main_module,
+        [
+            line_message_event("U1", "one", "token-1", message_id="m1"),
+            line_message_event("U2", "other", "token-2", message_id="m2"),
+            line_message_event("U1", "two", "token-3", message_id="m3"),
+        ],
+    )
+
+    assert response.status_code == 200
+    user_tokens = [
+        call.reply_token
+        for call in reply_message.calls
+        if call.reply_token in {"token-1", "token-3"}
+    ]
+    assert user_tokens == ["token-1", "token-3"]
+
+
+@pytest.mark.integration
+def test_non_message_events_only(
+    main_module: ModuleType, reply_message: _FakeReplyMessage
+) -> None:
+    response = _post(main_module, [{"type": "follow", "source": {"userId": "U1"}}])
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "No message to process"}
+    assert reply_message.calls == []
+
+
+@pytest.mark.integration
+def test_invalid_signature_returns_401(main_module: ModuleType) -> None:
+    with TestClient(main_module.app) as client:
+        response = client.post(
+            "/webhooks/line",
+            content=b'{"events":[]}',
+            headers={"X-Line-Signature": sign(b"{}")},
+        )
+
+    assert response.status_code == 401